@@ -5,38 +5,94 @@ a contemplation on dialogue without quoting it.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field, asdict
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Type
+from array import array
 import contextlib
+import functools
 import itertools as it
-import math
+import operator
 import os
-import random
+import secrets
 import sys
-import time
-import uuid
+import threading
 
-random.seed(113)  # deterministic enough to be revisited
+try:
+    from numba import get_num_threads, njit, prange
+    import numpy as np    # always present alongside numba
+except ImportError:    # numba is optional; the same loops then run as plain Python
+    njit = None
+
+def _native(fn: Callable) -> Callable:
+    return njit(cache=True)(fn) if njit is not None else fn
 
 # ==============================
 # I. PRIMITIVES
 # ==============================
 
-@dataclass(frozen=True)
-class Mark:
+class Mark(NamedTuple):
     """A single inscription on an abstract plane."""
     x: int
     y: int
     tone: float        # weight in [0,1]
     tag: str           # 'ask','answer','turn','doubt','care','resolve','gap'
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
-    marks: List[Mark] = field(default_factory=list)
+    """Marks held as four parallel columns; a Mark is formed only when asked for."""
+    xs: array = field(default_factory=lambda: array('i'))
+    ys: array = field(default_factory=lambda: array('i'))
+    tones: array = field(default_factory=lambda: array('d'))
+    tags: array = field(default_factory=lambda: array('I'))    # codes into TAGS
+
     def add(self, *m: Mark) -> None:
-        self.marks.extend(m)
+        if not m:
+            return
+        xs, ys, tones, tags = zip(*m)
+        self.xs += _coords(xs)
+        self.ys += _coords(ys)
+        self.tones += array('d', tones)
+        self.tags += array('I', map(tag_code, tags))
+
+    def add_arrays(self, xs: array, ys: array, tones: array, tags: array) -> None:
+        """Append whole columns at once; tags are already codes."""
+        if not len(xs) == len(ys) == len(tones) == len(tags):
+            raise ValueError(f"columns differ in length: {len(xs)}, {len(ys)}, {len(tones)}, {len(tags)}")
+        self.xs += xs; self.ys += ys; self.tones += tones; self.tags += tags
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # codes past ORDER were handed out by this process; carry their names so another can re-intern them
+        strangers = {c: TAGS[c] for c in set(self.tags) if c >= _STRANGER}
+        return _revive_layer, (self.xs, self.ys, self.tones, self.tags, strangers)
+
+    @property
+    def marks(self) -> Tuple[Mark, ...]:
+        """A read-only snapshot; add marks with add() or add_arrays()."""
+        return tuple(Mark(x, y, t, TAGS[c]) for x, y, t, c in zip(self.xs, self.ys, self.tones, self.tags))
+
+def _revive_layer(xs: array, ys: array, tones: array, tags: array, strangers: Dict[int, str]) -> Layer:
+    if strangers:
+        code = {c: tag_code(t) for c, t in strangers.items()}
+        tags = array('I', [code.get(c, c) for c in tags])
+    return Layer(xs, ys, tones, tags)
+
+_I32_MIN, _I32_MAX = -2**31, 2**31 - 1
+
+def _clip32(v: int) -> int:
+    return min(max(v, _I32_MIN), _I32_MAX)
+
+def _coords(values: Iterable[int]) -> array:
+    """An int32 coordinate column; points past its range are off any canvas and pinned to its edge.
+
+    Pinned points that land together count as one cell to braid.
+    """
+    values = list(values)
+    try:
+        return array('i', values)
+    except OverflowError:
+        return array('i', map(_clip32, values))
 
-@dataclass
+@dataclass(slots=True)
 class Field:
     width: int
     height: int
@@ -47,19 +103,80 @@ class Field:
 
     def render(self, legend: bool = True) -> str:
         # Compose layers by tone; higher tone overrides
-        grid: List[List[Tuple[float, str]]] = [[(0.0, ' ') for _ in range(self.width)] for _ in range(self.height)]
-        for layer in self.layers:
-            for m in layer.marks:
-                if 0 <= m.x < self.width and 0 <= m.y < self.height:
-                    old_tone, old_ch = grid[m.y][m.x]
-                    if m.tone >= old_tone:
-                        grid[m.y][m.x] = (m.tone, symbol(m.tag, m.tone))
-        lines = [''.join(ch for _, ch in row).rstrip() for row in grid]
+        W, H = self.width, self.height
+        tone = array('d', [0.0]) * (W * H)
+        cell = array('H', [0]) * (W * H)    # index into _CELLS; 0 is untouched
+        layers = self.layers
+        n_chunks = _parallel_chunks(sum(len(layer.xs) for layer in layers), W * H)
+        if n_chunks > 1:
+            xs, ys, tones, tags = _concat(layers)
+            _compose_parallel(xs, ys, tones, tags, tone, cell, W, H, n_chunks)
+        else:
+            merge = _merge_max_tone
+            for layer in layers:
+                merge(layer.xs, layer.ys, layer.tones, layer.tags, tone, cell, W, H)
+        # one character per cell, whose code point is the cell code; translate swaps in the symbols
+        text = cell.tobytes().decode(_UTF16)
+        lines = [text[y * W:(y + 1) * W].translate(_CELLS).rstrip() for y in range(H)]
         s = '\n'.join(lines)
         if legend:
-            s += "\n legend: " + '  '.join(f"{symbol(t,0.7)}={t}" for t in ORDER if t != 'gap')
+            s += LEGEND_LINE
         return s
 
+@_native
+def _merge_max_tone(xs, ys, tones, tags, out_tone, out_cell, W, H):
+    """Lay one layer onto flat y*W+x buffers; an equal tone still overrides."""
+    for x, y, tone, code in zip(xs, ys, tones, tags):
+        if 0 <= x < W and 0 <= y < H:
+            idx = y * W + x
+            if tone >= out_tone[idx]:
+                out_tone[idx] = tone
+                # tone is already >= 0 here, so the clamp in symbol() reduces to two compares
+                out_cell[idx] = min(code, _STRANGER) * 3 + (2 if tone >= 1.0 else 1 if tone >= 0.5 else 0) + 1
+
+_CHUNK_MIN = 1 << 14    # fewer marks per thread than this are not worth waking the pool for
+
+def _parallel_chunks(n_marks: int, size: int) -> int:
+    """Threads for the parallel composite; 1 means stay sequential.
+
+    Every chunk gets its own W*H tile and the fold visits each tile's cells,
+    so a chunk must carry at least as many marks as its tile has cells.
+    """
+    if _compose_parallel is None:
+        return 1
+    return max(1, min(get_num_threads(), n_marks // max(_CHUNK_MIN, size)))
+
+if njit is not None:
+    def _compose_parallel(xs, ys, tones, tags, out_tone, out_cell, W, H, n_chunks):
+        # parallel loops want ndarrays; asarray gives zero-copy views of the columns and buffers
+        _compose_tiles(*map(np.asarray, (xs, ys, tones, tags, out_tone, out_cell)), W, H, n_chunks)
+
+    @njit(parallel=True, cache=True)
+    def _compose_tiles(xs, ys, tones, tags, out_tone, out_cell, W, H, n_chunks):
+        """All layers at once: each chunk of marks onto its own tile, then the tiles in order."""
+        n = len(xs)
+        size = W * H
+        tile_tone = np.zeros((n_chunks, size))
+        tile_cell = np.zeros((n_chunks, size), np.uint16)
+        for c in prange(n_chunks):
+            # chunks are contiguous runs of marks, so each tile keeps the sequential tie rule
+            for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+                x = xs[i]
+                y = ys[i]
+                if 0 <= x < W and 0 <= y < H:
+                    idx = y * W + x
+                    tone = tones[i]
+                    if tone >= tile_tone[c, idx]:
+                        tile_tone[c, idx] = tone
+                        tile_cell[c, idx] = min(tags[i], _STRANGER) * 3 + (2 if tone >= 1.0 else 1 if tone >= 0.5 else 0) + 1
+        for idx in prange(size):
+            for c in range(n_chunks):
+                if tile_cell[c, idx] != 0 and tile_tone[c, idx] >= out_tone[idx]:
+                    out_tone[idx] = tile_tone[c, idx]
+                    out_cell[idx] = tile_cell[c, idx]
+else:
+    _compose_parallel = None
+
 # ==============================
 # II. LEXICON
 # ==============================
@@ -76,10 +193,35 @@ PALETTE = {
     'resolve': '∎',
 }
 
+def _symbol_row(base: str) -> List[str]:
+    """A symbol's three weights, faint to full."""
+    return [base * k for k in (1, 2, 3)]
+
+TAGS: List[str] = list(ORDER)    # a Layer's tag codes index this
+TAG_CODE: Dict[str, int] = {t: i for i, t in enumerate(TAGS)}
+_STRANGER = len(ORDER)    # every tag outside ORDER shares this row of SYMBOL_LUT
+SYMBOL_LUT: List[List[str]] = [_symbol_row(PALETTE[t]) for t in ORDER] + [_symbol_row('?')]    # [tag code][tone bucket]
+_CELLS: List[str] = [' '] + [s for row in SYMBOL_LUT for s in row]    # 1 + min(code, _STRANGER)*3 + bucket -> cell text
+_UTF16 = 'utf-16-le' if sys.byteorder == 'little' else 'utf-16-be'    # reads an array('H') as text
+
+_ADMIT = threading.Lock()    # one stranger at a time, so two never draw the same code
+
+def tag_code(tag: str) -> int:
+    """Small integer standing for a tag; strangers are given one on arrival."""
+    code = TAG_CODE.get(tag)
+    if code is None:
+        with _ADMIT:
+            code = TAG_CODE.get(tag)
+            if code is None:
+                TAGS.append(tag)
+                code = TAG_CODE[tag] = len(TAGS) - 1
+    return code
+
 def symbol(tag: str, tone: float) -> str:
-    base = PALETTE.get(tag, '?')
-    k = 1 + int(max(0.0, min(1.0, tone)) * 2)
-    return base * k
+    row = SYMBOL_LUT[min(TAG_CODE.get(tag, _STRANGER), _STRANGER)]
+    return row[int(max(0.0, min(1.0, tone)) * 2)]
+
+LEGEND_LINE = "\n legend: " + '  '.join(f"{symbol(t,0.7)}={t}" for t in ORDER if t != 'gap')
 
 # ==============================
 # III. DYNAMICS (non-musical transformations)
@@ -114,6 +256,10 @@ def perturb(x: int, y: int, seed: int) -> Tuple[int, int]:
 
 def fold_trace(trace: Iterable[str]) -> int:
     """Hash-like folding of a tag trace into a compact coordinate bias."""
+    return _fold_trace_tuple(tuple(trace))
+
+@functools.lru_cache(maxsize=256)
+def _fold_trace_tuple(trace: Tuple[str, ...]) -> int:
     h = 0
     for t in trace:
         h = ((h << 5) - h) ^ (ord(t[0]) if t else 0)
@@ -123,54 +269,168 @@ def fold_trace(trace: Iterable[str]) -> int:
 # IV. MAKERS (constructive idioms)
 # ==============================
 
-def inscribe(field: Field, origin: Tuple[int,int], steps: int, tag: str, stride: int = 1, tone: float = 0.5) -> Layer:
-    """Draw a directed path by writing Marks, bending gently when stressed."""
+# torsion: tag influences direction without "being" direction
+_TORSION: Dict[str, Tuple[str, str]] = {    # per-step x, y increments, in i and stride
+    'ask'    : ('stride', '-(i % 2 == 0)'),
+    'answer' : ('stride', 'int(i % 3 == 0)'),
+    'turn'   : ('1 if i % 2 == 0 else 0', '1 if i % 2 else -1'),
+    'doubt'  : ('stride', '1 if (i//2) % 2 else -1'),
+    'care'   : ('stride', '0'),
+    'resolve': ('stride', '0'),
+}
+
+_INSCRIBER = """
+def _inscribe(field, origin, steps, tag, stride, tone):
     ox, oy = origin
+    x_step = {x_step}
+    y_step = {y_step}
+    bias = {bias}
+    # the whole path at once: each mark sits where the walk stood, then drifts
+    r = [((i + bias) * 6364136223846793005 + 1) & 0xFFFFFFFF for i in range(steps)]
     layer = Layer()
-    x, y = ox, oy
-    for i in range(steps):
-        px, py = perturb(x, y, i + fold_trace([tag]))
-        layer.add(Mark(px, py, tone, tag))
-        # torsion: tag influences direction without "being" direction
-        if tag == 'ask':
-            x += stride; y -= (i % 2 == 0)
-        elif tag == 'answer':
-            x += stride; y += (i % 3 == 0)
-        elif tag == 'turn':
-            x += (1 if i % 2 == 0 else 0); y += (1 if i % 2 else -1)
-        elif tag == 'doubt':
-            x += stride; y += (1 if (i//2) % 2 else -1)
-        elif tag == 'care':
-            x += stride; y += 0
-        elif tag == 'resolve':
-            x += stride; y += (0 if i else 0)
-        else:
-            x += stride
+    layer.add_arrays(
+        _coords([x + (ri >> 8) % 3 - 1 for x, ri in zip(it.accumulate(x_step, initial=ox), r)]),
+        _coords([y + (ri >> 16) % 3 - 1 for y, ri in zip(it.accumulate(y_step, initial=oy), r)]),
+        array('d', [tone]) * steps,
+        array('I', [{code}]) * steps,
+    )
     field.deposit(layer)
     return layer
+"""
+
+def _increments(expr: str) -> str:
+    """An expression in i becomes a comprehension; one without i, a repeated list."""
+    if 'i' in compile(expr, '<torsion>', 'eval').co_names:
+        return f"[{expr} for i in range(steps)]"
+    return f"[{expr}] * steps"
+
+def _specialize(tag: Optional[str], x_expr: str, y_expr: str) -> Callable[..., Layer]:
+    """Compile an inscriber with the tag's torsion, fold and code written in as constants."""
+    src = _INSCRIBER.format(
+        x_step=_increments(x_expr),
+        y_step=_increments(y_expr),
+        bias=fold_trace((tag,)) if tag is not None else 'fold_trace((tag,))',
+        code=tag_code(tag) if tag is not None else 'tag_code(tag)',
+    )
+    # the generated code sees only what is named here, so nothing it uses can look unused
+    ns: Dict[str, Any] = {
+        'it': it, 'array': array, 'Layer': Layer, '_coords': _coords,
+        'fold_trace': fold_trace, 'tag_code': tag_code,
+    }
+    exec(compile(src, f"<inscribe {tag or 'stranger'}>", 'exec'), ns)
+    return ns['_inscribe']
+
+_INSCRIBE_BY_TAG: Dict[str, Callable[..., Layer]] = {tag: _specialize(tag, *xy) for tag, xy in _TORSION.items()}
+_inscribe_stranger = _specialize(None, 'stride', '0')    # unknown tags walk straight
+
+def inscribe(field: Field, origin: Tuple[int,int], steps: int, tag: str, stride: int = 1, tone: float = 0.5) -> Layer:
+    """Draw a directed path by writing Marks, bending gently when stressed."""
+    return _INSCRIBE_BY_TAG.get(tag, _inscribe_stranger)(field, origin, steps, tag, stride, tone)
 
 def braid(*layers: Layer) -> Layer:
     """Composite layer where later marks override earlier by tone."""
-    merged = Layer()
-    bag: Dict[Tuple[int,int], Mark] = {}
+    return Layer(*_braid_keep_max(*_concat(layers)))
+
+def _concat(layers: Iterable[Layer]) -> Tuple[array, array, array, array]:
+    """Every layer's columns end to end, in order."""
+    xs, ys, tones, tags = array('i'), array('i'), array('d'), array('I')
     for layer in layers:
-        for m in layer.marks:
-            key = (m.x, m.y)
-            if key not in bag or bag[key].tone <= m.tone:
-                bag[key] = m
-    merged.marks = list(bag.values())
-    return merged
+        xs += layer.xs; ys += layer.ys; tones += layer.tones; tags += layer.tags
+    return xs, ys, tones, tags
+
+if njit is not None:
+    def _braid_keep_max(xs, ys, tones, tags):
+        """The strongest mark per cell, the latest among equals, as columns in arrival order."""
+        picks = _strongest_per_cell(xs, ys, tones)
+        # index zero-copy views, then copy each result straight into a new array's buffer
+        return tuple(array(c.typecode, np.asarray(c)[picks].tobytes()) for c in (xs, ys, tones, tags))
+
+    @njit(cache=True)
+    def _strongest_per_cell(xs, ys, tones):
+        """Ascending indices of the strongest mark per cell; among equals, the latest."""
+        n = len(xs)
+        keys = np.empty(n, np.int64)
+        for i in range(n):
+            keys[i] = (np.int64(ys[i]) << 32) | (xs[i] & 0xFFFFFFFF)
+        # sort by cell, then reduce each run of equal keys to its strongest
+        order = np.argsort(keys)
+        picks = np.empty(n, np.int64)
+        m = 0
+        j = 0
+        while j < n:
+            best = order[j]
+            k = j + 1
+            while k < n and keys[order[k]] == keys[best]:
+                o = order[k]
+                if tones[o] > tones[best] or (tones[o] == tones[best] and o > best):
+                    best = o
+                k += 1
+            picks[m] = best
+            m += 1
+            j = k
+        picks = picks[:m]
+        picks.sort()
+        return picks
+
+else:
+    def _braid_keep_max(xs, ys, tones, tags):
+        """The strongest mark per cell, the latest among equals, as columns in arrival order."""
+        keys = _cell_keys(xs, ys)
+        bag: Dict[int, int] = {}    # cell -> index of its strongest mark so far
+        claim = bag.setdefault
+        columns = (xs, ys, tones, tags)
+        probe = keys[::97]
+        if 2 * len(set(probe)) < len(probe):
+            # crowded cells: most marks lose, so only the winners are worth tracking
+            for i, key, tone in zip(it.count(), keys, tones):
+                if tones[claim(key, i)] <= tone:
+                    bag[key] = i
+        else:
+            lost: List[int] = []
+            drop = lost.append
+            for i, key, tone in zip(it.count(), keys, tones):
+                j = claim(key, i)
+                if j != i:
+                    if tones[j] <= tone:
+                        bag[key] = i; drop(j)
+                    else:
+                        drop(i)
+            if not lost:
+                return columns
+            if len(lost) <= len(bag):
+                # few losers: copy the runs between them
+                lost.sort()
+                return tuple(_cut(c, lost) for c in columns)
+        # few winners: pick them out
+        pick = operator.itemgetter(*sorted(bag.values()))
+        return tuple(array(c.typecode, pick(c)) for c in columns)
+
+    def _cell_keys(xs: array, ys: array) -> array:
+        """One int per cell: each (x, y) pair's eight bytes read back as a single int64."""
+        pairs = array('i', bytes(8 * len(xs)))
+        pairs[0::2] = xs; pairs[1::2] = ys
+        keys = array('q'); keys.frombytes(pairs.tobytes())
+        return keys
+
+    def _cut(column: array, lost: List[int]) -> array:
+        out, prev = array(column.typecode), 0
+        for i in lost:
+            out += column[prev:i]; prev = i + 1
+        out += column[prev:]
+        return out
 
 # ==============================
-# V. METAPATTERN (metaclass as quiet signature)
+# V. METAPATTERN (subclass hook as quiet signature)
 # ==============================
 
-class Signature(type):
-    def __new__(mcls, name, bases, ns, token=None):
-        ns['_token'] = token or uuid.uuid4().hex[:8]
-        return super().__new__(mcls, name, bases, ns)
+class Signature:
+    """Every descendant carries a key; one is drawn only if none is given."""
+    _token: str
+    def __init_subclass__(cls, token: Optional[str] = None, **kw: Any) -> None:
+        super().__init_subclass__(**kw)
+        cls._token = token or secrets.token_hex(4)
 
-class Witness(metaclass=Signature, token="silent"):
+class Witness(Signature, token="silent"):
     """Exists only to remind us that form carries an unseen key."""
     def key(self) -> str:
         return self._token